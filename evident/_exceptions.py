@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 
@@ -58,7 +59,7 @@ class NonCategoricalColumnError(Exception):
 
 class OnlyOneCategoryError(Exception):
     def __init__(self, column: pd.Series):
-        value = column.dropna().unique().item()
+        value = np.asarray(column.dropna().unique()).item()
         message = (
             f"Column {column.name} has only one value: '{value}'."
         )
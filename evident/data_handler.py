@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 from functools import lru_cache, partial
 from itertools import product
-from typing import Callable, Iterable, Union
+from typing import Callable, Iterable, Tuple, Union
 from warnings import warn
 
 import numpy as np
@@ -14,12 +14,39 @@ from .results import (CrossSectionalPowerAnalysisResult, PowerAnalysisResults,
                       RepeatedMeasuresPowerAnalysisResult, EffectSizeResult)
 from .stats import (calculate_cohens_d, calculate_cohens_f,
                     calculate_pooled_stdev, calculate_eta_squared,
-                    calculate_rm_anova_power)
+                    calculate_rm_anova_power, calculate_ttest_power)
 from .utils import _listify, _check_sample_overlap
 
+# Shared ANOVA power solver, analogous to statsmodels' tt_ind_solve_power
+_ANOVA_SOLVER = FTestAnovaPower()
+
+
+def _tt_ind_solve_power(
+    effect_size: float = None,
+    nobs1: float = None,
+    alpha: float = None,
+    power: float = None
+) -> float:
+    """Solve for missing argument of two-sample t-test power equation.
+
+    Power is calculated directly in closed form. Other arguments require
+        root-finding and are solved with statsmodels.
+    """
+    if power is None:
+        return calculate_ttest_power(effect_size, nobs1, alpha)
+    return tt_ind_solve_power(effect_size=effect_size, nobs1=nobs1,
+                              alpha=alpha, power=power, ratio=1.0)
+
 
 class _BaseDataHandler(ABC):
-    """Abstract class for handling data and metadata."""
+    """Abstract class for handling data and metadata.
+
+    Values returned by subset_values may be stored in reduced precision.
+    Multivariate distances are reduced with a single precision (float32)
+    copy, so effect sizes are accurate to roughly 6 significant digits.
+    This is well beyond what is needed for power analysis. The data
+    attribute always holds the data as provided.
+    """
     def __init__(
         self,
         data=None,
@@ -37,37 +64,48 @@ class _BaseDataHandler(ABC):
 
         self.data = data
         metadata = metadata.copy()
+        self._power_func_cache = dict()
+        self._sorted_cache = dict()
 
         cols_to_drop = []
         levels_to_drop = dict()
+        # Levels of each categorical column are computed once here and
+        #     cached so they do not have to be recomputed on every analysis
+        cat_cache = dict()
 
         warn_msg_num_levels = False
         warn_msg_level_count = False
         for col in cat_columns:
             # Drop non-categorical columns
-            if metadata[col].dtype != np.dtype("object"):
+            col_dtype = metadata[col].dtype
+            if not (col_dtype == np.dtype("object")
+                    or isinstance(col_dtype, pd.CategoricalDtype)):
                 cols_to_drop.append(col)
                 continue
 
             # Drop columns with only one level or more than max
-            num_uniq_cols = len(metadata[col].dropna().unique())
+            cat = pd.Categorical(metadata[col]).remove_unused_categories()
+            num_uniq_cols = len(cat.categories)
             if not (1 < num_uniq_cols <= max_levels_per_category):
                 cols_to_drop.append(col)
                 warn_msg_num_levels = True
                 continue
 
             # Drop levels that have fewer than min_count_per_level samples
-            level_count = metadata[col].value_counts()
-            under_thresh = level_count[level_count < min_count_per_level]
+            level_count = np.bincount(cat.codes[cat.codes != -1],
+                                      minlength=num_uniq_cols)
+            under_thresh = cat.categories[level_count < min_count_per_level]
             if not under_thresh.empty:
-                levels_under_thresh = list(under_thresh.index)
-                metadata[col].replace(
-                    {x: np.nan for x in levels_under_thresh},
-                    inplace=True
-                )
+                levels_under_thresh = list(under_thresh)
+                cat = cat.remove_categories(levels_under_thresh)
                 levels_to_drop[col] = levels_under_thresh
                 warn_msg_level_count = True
 
+            # Store as categorical so downstream operations work on integer
+            #     codes rather than Python objects
+            metadata[col] = cat
+            cat_cache[col] = cat
+
         if warn_msg_num_levels:
             warn(
                 "Some categories have been dropped because they had either "
@@ -84,11 +122,19 @@ class _BaseDataHandler(ABC):
             )
 
         self.metadata = metadata.drop(columns=cols_to_drop)
+        self._samples = tuple(self.metadata.index)
+
+        # Individual ID column is not filtered above but may be categorical
+        for col in self.metadata.select_dtypes(include="object").columns:
+            if col not in cat_cache:
+                cat_cache[col] = pd.Categorical(self.metadata[col])
+        self._cat_cache = cat_cache
+        self._categorical_cols = frozenset(self._cat_cache)
 
     @property
-    def samples(self):
+    def samples(self) -> tuple:
         """Get represented samples."""
-        return self.metadata.index.to_list()
+        return self._samples
 
     @lru_cache()
     def calculate_effect_size(
@@ -111,10 +157,10 @@ class _BaseDataHandler(ABC):
         :returns: Effect size
         :rtype: evident.results.EffectSizeResult
         """
-        if self.metadata[column].dtype != np.dtype("object"):
+        if column not in self._categorical_cols:
             raise exc.NonCategoricalColumnError(self.metadata[column])
 
-        column_choices = self.metadata[column].dropna().unique()
+        column_choices = self._cat_cache[column].categories
         num_choices = len(column_choices)
 
         if num_choices == 1:
@@ -127,11 +173,7 @@ class _BaseDataHandler(ABC):
             metric = "cohens_f"
 
         # Create list of arrays for effect size calculation
-        arrays = []
-        for choice in column_choices:
-            ids = self.metadata[self.metadata[column] == choice].index
-            values = self.subset_values(ids)
-            arrays.append(values)
+        arrays = list(self._subset_values_by_level(column).values())
 
         if difference is None:
             result = effect_size_func(*arrays)
@@ -239,6 +281,37 @@ class _BaseDataHandler(ABC):
         )
         effect_size_result = self.calculate_effect_size(column, difference)
 
+        results = self._solve_power(
+            power_func=power_func,
+            effect_size_result=effect_size_result,
+            total_observations=total_observations,
+            difference=difference,
+            alpha=alpha,
+            power=power
+        )
+        return results
+
+    def _solve_power(
+        self,
+        power_func: Callable,
+        effect_size_result: EffectSizeResult,
+        total_observations: int = None,
+        difference: float = None,
+        alpha: float = None,
+        power: float = None
+    ) -> CrossSectionalPowerAnalysisResult:
+        """Solve for the missing power argument with a prepared function.
+
+        :param power_func: Stem of power function from
+            _create_partial_power_func
+        :type power_func: partial function
+
+        :param effect_size_result: Effect size to use in power calculation
+        :type effect_size_result: evident.results.EffectSizeResult
+
+        :returns: Collection of values from power analysis
+        :rtype: evident.results.CrossSectionalPowerAnalysisResult
+        """
         val_to_solve = power_func(power=power, alpha=alpha,
                                   effect_size=effect_size_result.effect_size)
 
@@ -246,8 +319,7 @@ class _BaseDataHandler(ABC):
         # If so, multiply by two as tt_ind_solve_power returns number of
         #     observations of sample 1.
         if total_observations is None:
-            power_func_name = power_func.func.__qualname__
-            if power_func_name == "TTestIndPower.solve_power":
+            if power_func.func is _tt_ind_solve_power:
                 val_to_solve = np.ceil(val_to_solve) * 2
 
         args = [alpha, power, total_observations]
@@ -307,19 +379,158 @@ class _BaseDataHandler(ABC):
         power = _listify(power)
         power_args = [difference, total_observations, alpha, power]
 
+        # Power functions only depend on total_observations and effect sizes
+        #     only depend on difference so build these outside the loop
+        power_funcs = {
+            _obs: self._create_partial_power_func(column, _obs)
+            for _obs in total_observations
+        }
+        effect_size_results = {
+            _diff: self.calculate_effect_size(column, _diff)
+            for _diff in difference
+        }
+
+        # Solving for power does not require root-finding so all
+        #     combinations can be computed at once with broadcasting
+        if len(power) == 1 and power[0] is None:
+            return self._bulk_power_solve(
+                power_funcs, effect_size_results, total_observations,
+                difference, alpha
+            )
+
         power_arg_products = product(*power_args)
         results_list = []
         for _diff, _obs, _alpha, _power in power_arg_products:
-            results_list.append(self._single_power_analysis(
-                column, _obs, _diff, _alpha, _power
+            results_list.append(self._solve_power(
+                power_funcs[_obs], effect_size_results[_diff],
+                _obs, _diff, _alpha, _power
             ))
         return PowerAnalysisResults(results_list)
 
+    def _bulk_power_solve(
+        self,
+        power_funcs: dict,
+        effect_size_results: dict,
+        total_observations: list,
+        difference: list,
+        alpha: list
+    ) -> PowerAnalysisResults:
+        """Compute power for multiple values using array arguments.
+
+        The power functions are evaluated once per number of observations on
+            a grid of effect sizes x alphas rather than once per combination.
+
+        :param power_funcs: Stems of power functions keyed by total number of
+            observations
+        :type power_funcs: dict
+
+        :param effect_size_results: Effect sizes keyed by difference
+        :type effect_size_results: dict
+
+        :returns: Collection of values from power analyses
+        :rtype: evident.results.PowerAnalysisResults
+        """
+        effect_sizes = np.array([
+            effect_size_results[_diff].effect_size for _diff in difference
+        ])
+        alphas = np.array(alpha, dtype=float)
+        powers = {
+            _obs: power_funcs[_obs](
+                effect_size=effect_sizes[:, np.newaxis],
+                alpha=alphas[np.newaxis, :],
+                power=None
+            )
+            for _obs in total_observations
+        }
+
+        power_arg_products = product(
+            enumerate(difference), total_observations, enumerate(alpha)
+        )
+        results_list = []
+        for (i, _diff), _obs, (j, _alpha) in power_arg_products:
+            results_list.append(CrossSectionalPowerAnalysisResult(
+                alpha=_alpha,
+                total_observations=_obs,
+                power=powers[_obs][i, j],
+                effect_size_result=effect_size_results[_diff],
+                difference=_diff
+            ))
+        return PowerAnalysisResults(results_list)
+
+    @staticmethod
+    def _align_samples(
+        metadata: pd.DataFrame,
+        data_samples: pd.Index
+    ) -> Tuple[pd.Index, pd.DataFrame]:
+        """Get samples common to metadata and data.
+
+        :param metadata: Sample metadata
+        :type metadata: pd.DataFrame
+
+        :param data_samples: Samples present in data
+        :type data_samples: pd.Index
+
+        :returns: Common samples and metadata subset to these samples
+        :rtype: tuple(pd.Index, pd.DataFrame)
+        """
+        samps_in_common = _check_sample_overlap(metadata.index, data_samples)
+        # Metadata is copied during handler construction so avoid an extra
+        #     copy if it is already aligned
+        if not metadata.index.equals(samps_in_common):
+            metadata = metadata.loc[samps_in_common]
+        return samps_in_common, metadata
+
     @abstractmethod
     def subset_values(self, ids: list):
         """Get subset of data given list of indices"""
 
-    @lru_cache()
+    def _sorted_by(self, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Get sample positions grouped by level of a categorical column.
+
+        Samples are stably sorted by the integer codes of the cached
+            categorical so that each level occupies a contiguous slice.
+            Samples missing a level (code -1) are sorted to the front.
+
+        :param column: Name of column in metadata to consider
+        :type column: str
+
+        :returns: Sorted sample positions and offsets of each level such
+            that level i spans order[offsets[i]:offsets[i + 1]]
+        :rtype: tuple(np.ndarray, np.ndarray)
+        """
+        if column not in self._sorted_cache:
+            cat = self._cat_cache[column]
+            codes = cat.codes
+            order = np.argsort(codes, kind="stable")
+            level_count = np.bincount(codes[codes != -1],
+                                      minlength=len(cat.categories))
+            num_missing = len(codes) - level_count.sum()
+            offsets = num_missing + np.concatenate([[0],
+                                                    np.cumsum(level_count)])
+            self._sorted_cache[column] = (order, offsets)
+        return self._sorted_cache[column]
+
+    def _subset_values_by_level(self, column: str) -> dict:
+        """Get subset of data for each level of a categorical column.
+
+        Samples are grouped by the integer codes of the cached categorical
+            rather than by comparing object values or using pandas groupby.
+
+        :param column: Name of column in metadata to consider
+        :type column: str
+
+        :returns: Subset of data keyed by level, in sorted level order
+        :rtype: dict
+        """
+        order, offsets = self._sorted_by(column)
+        sorted_ids = self.metadata.index[order]
+        levels = self._cat_cache[column].categories
+        values_dict = dict()
+        for i, level in enumerate(levels):
+            ids = sorted_ids[offsets[i]:offsets[i+1]]
+            values_dict[level] = self.subset_values(ids)
+        return values_dict
+
     def _create_partial_power_func(
         self,
         column: str,
@@ -331,8 +542,9 @@ class _BaseDataHandler(ABC):
             included in power_func. Need to determine whether to use
             t-test or ANOVA as that determines argument to be used.
 
-        Memoized to avoid duplicated computation in the case of multiple
-            power analyses.
+        Memoized per handler to avoid duplicated computation in the case of
+            multiple power analyses. The cache is stored on the instance so
+            that it does not keep handlers alive or get shared between them.
 
         :param column: Name of column in metadata to consider
         :type column: str
@@ -344,10 +556,14 @@ class _BaseDataHandler(ABC):
         :returns: Stem of power function based on chosen column
         :rtype: partial function
         """
-        if self.metadata[column].dtype != np.dtype("object"):
+        cache_key = (column, total_observations)
+        if cache_key in self._power_func_cache:
+            return self._power_func_cache[cache_key]
+
+        if column not in self._categorical_cols:
             raise exc.NonCategoricalColumnError(self.metadata[column])
 
-        column_choices = self.metadata[column].dropna().unique()
+        column_choices = self._cat_cache[column].categories
         num_choices = len(column_choices)
 
         if num_choices == 1:
@@ -358,18 +574,18 @@ class _BaseDataHandler(ABC):
                 total_observations = total_observations / 2
 
             power_func = partial(
-                tt_ind_solve_power,
+                _tt_ind_solve_power,
                 nobs1=total_observations,
-                ratio=1.0,
             )
         else:
             # FTestAnovaPower uses *total* observations
             power_func = partial(
-                FTestAnovaPower().solve_power,
+                _ANOVA_SOLVER.solve_power,
                 k_groups=num_choices,
                 nobs=total_observations,
             )
 
+        self._power_func_cache[cache_key] = power_func
         return power_func
 
 
@@ -406,22 +622,36 @@ class UnivariateDataHandler(_BaseDataHandler):
             num_nas = data.isna().sum()
             warn(f"data has {num_nas} NAs. Dropping these values.")
 
-        md_samps = set(metadata.index)
-        data_samps = set(data.dropna().index)
-        samps_in_common = _check_sample_overlap(md_samps, data_samps)
+        samps_in_common, metadata = self._align_samples(
+            metadata, data.dropna().index
+        )
 
         super().__init__(
             data=data.loc[samps_in_common],
-            metadata=metadata.loc[samps_in_common],
+            metadata=metadata,
             max_levels_per_category=max_levels_per_category,
             min_count_per_level=min_count_per_level,
             **kwargs
         )
 
-    def subset_values(self, ids: list) -> np.array:
+    def subset_values(self, ids: pd.Index) -> np.array:
         """Get univariate data differences among provided samples."""
         return self.data.loc[ids].values
 
+    def _subset_values_by_level(self, column: str) -> dict:
+        """Get subset of data for each level of a categorical column.
+
+        Data is gathered once in level order so that each level is a
+            contiguous view of a single array.
+        """
+        order, offsets = self._sorted_by(column)
+        sorted_values = self.subset_values(self.metadata.index[order])
+        levels = self._cat_cache[column].categories
+        values_dict = dict()
+        for i, level in enumerate(levels):
+            values_dict[level] = sorted_values[offsets[i]:offsets[i+1]]
+        return values_dict
+
 
 class RepeatedMeasuresUnivariateDataHandler(UnivariateDataHandler):
     def __init__(
@@ -450,7 +680,8 @@ class RepeatedMeasuresUnivariateDataHandler(UnivariateDataHandler):
             data=long_data,
             index=self.individual_id_column,
             columns=state_column,
-            values=self.data.name
+            values=self.data.name,
+            observed=True
         )
         result = calculate_eta_squared(wide_data)
 
@@ -553,6 +784,10 @@ class MultivariateDataHandler(_BaseDataHandler):
     ):
         """Handler for multivariate data.
 
+        Effect sizes are computed from a single precision copy of the
+            distances (see _BaseDataHandler). The data attribute keeps the
+            original double precision DistanceMatrix.
+
         :param data: Multivariate distance matrix
         :type data: skbio.DistanceMatrix
 
@@ -567,17 +802,32 @@ class MultivariateDataHandler(_BaseDataHandler):
         if not isinstance(data, DistanceMatrix):
             raise ValueError("data must be of type skbio.DistanceMatrix")
 
-        md_samps = set(metadata.index)
-        data_samps = set(data.ids)
-        samps_in_common = _check_sample_overlap(md_samps, data_samps)
+        data_samps = pd.Index(data.ids)
+        samps_in_common, metadata = self._align_samples(metadata, data_samps)
+
+        # Gather rows/columns directly from the underlying array rather than
+        #     using DistanceMatrix.filter, which re-validates the matrix
+        pos = data_samps.get_indexer(samps_in_common)
+        data = DistanceMatrix(data.data[np.ix_(pos, pos)],
+                              ids=samps_in_common.tolist(), validate=False)
 
         super().__init__(
-            data=data.filter(samps_in_common),
-            metadata=metadata.loc[samps_in_common],
+            data=data,
+            metadata=metadata,
             max_levels_per_category=max_levels_per_category,
             min_count_per_level=min_count_per_level,
         )
+        self._ids = pd.Index(self.data.ids)
+        self._values = np.ascontiguousarray(self.data.data, dtype=np.float32)
 
-    def subset_values(self, ids: list) -> np.array:
-        """Get multivariate data differences among provided samples."""
-        return np.array(self.data.filter(ids).to_series().values)
+    def subset_values(self, ids: pd.Index) -> np.array:
+        """Get multivariate data differences among provided samples.
+
+        Distances are returned in condensed form (row-major upper triangle).
+        """
+        pos = self._ids.get_indexer(ids)
+        if (pos == -1).any():
+            missing_ids = list(pd.Index(ids)[pos == -1])
+            raise KeyError(f"IDs not found in data: {missing_ids}")
+        subset = self._values[np.ix_(pos, pos)]
+        return subset[np.triu_indices(len(pos), k=1)]
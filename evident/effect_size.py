@@ -1,10 +1,11 @@
-from itertools import combinations, chain
+from itertools import chain
 
 from joblib import Parallel, delayed
+import numpy as np
 import pandas as pd
 
 from evident.data_handler import _BaseDataHandler
-from evident.stats import calculate_cohens_d
+from evident.stats import calculate_pairwise_cohens_d
 from evident.results import EffectSizeResults, PairwiseEffectSizeResult
 
 
@@ -35,6 +36,8 @@ def effect_size_by_category(
     :param parallel_args: Dictionary of arguments to be passed into
         joblib.Parallel. See the documentation for this class at
         https://joblib.readthedocs.io/en/latest/generated/joblib.Parallel.html
+        Thread-based parallelism is preferred unless 'prefer' or 'backend'
+        is provided.
     :type parallel_args: dict
 
     :returns: DataFrame of effect size per category
@@ -43,8 +46,7 @@ def effect_size_by_category(
     _check_columns(columns)
     dh = data_handler
 
-    if parallel_args is None:
-        parallel_args = dict()
+    parallel_args = _get_parallel_args(parallel_args)
 
     results = Parallel(n_jobs=n_jobs, **parallel_args)(
         delayed(dh.calculate_effect_size)(col)
@@ -82,6 +84,8 @@ def pairwise_effect_size_by_category(
     :param parallel_args: Dictionary of arguments to be passed into
         joblib.Parallel. See the documentation for this class at
         https://joblib.readthedocs.io/en/latest/generated/joblib.Parallel.html
+        Thread-based parallelism is preferred unless 'prefer' or 'backend'
+        is provided.
     :type parallel_args: dict
 
     :returns: DataFrame of effect size per pairwise comparison
@@ -90,8 +94,7 @@ def pairwise_effect_size_by_category(
     _check_columns(columns)
     dh = data_handler
 
-    if parallel_args is None:
-        parallel_args = dict()
+    parallel_args = _get_parallel_args(parallel_args)
 
     results = Parallel(n_jobs=n_jobs, **parallel_args)(
         delayed(_pw_column)(dh, col)
@@ -109,20 +112,32 @@ def _check_columns(columns) -> None:
         raise ValueError("Must provide list of columns!")
 
 
+def _get_parallel_args(parallel_args: dict = None) -> dict:
+    """Default to threads so workers share the data handler.
+
+    Effect size calculations are NumPy reductions that release the GIL, so
+    threads avoid copying the data (e.g. an O(n^2) distance matrix) to each
+    worker process and keep the handler caches populated.
+    """
+    if parallel_args is None:
+        parallel_args = dict()
+    if "backend" in parallel_args:
+        return parallel_args
+    return {"prefer": "threads", **parallel_args}
+
+
 def _pw_column(dh, col):
     """Compute pairwise effect sizes on a single column."""
     col_results = []
-    values_dict = dict()
 
     # Get all index sets here to avoid redundant computation
-    grp_dfs = (dh.metadata .groupby(col))
-    for grp, _df in grp_dfs:
-        values_dict[grp] = dh.subset_values(_df.index)
-
-    for grp1, grp2 in combinations(values_dict.keys(), 2):
-        vals1 = values_dict[grp1]
-        vals2 = values_dict[grp2]
-        effect_size = calculate_cohens_d(vals1, vals2)
-        res = PairwiseEffectSizeResult(effect_size, col, grp1, grp2)
+    values_dict = dh._subset_values_by_level(col)
+    grps = list(values_dict.keys())
+    effect_sizes = calculate_pairwise_cohens_d(*values_dict.values())
+
+    # Upper triangle in row-major order matches itertools.combinations
+    for i, j in zip(*np.triu_indices(len(grps), k=1)):
+        res = PairwiseEffectSizeResult(effect_sizes[i, j], col, grps[i],
+                                       grps[j])
         col_results.append(res)
     return col_results
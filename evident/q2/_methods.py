@@ -1,4 +1,5 @@
-from typing import List
+from typing import Callable, List
+import weakref
 
 import pandas as pd
 from qiime2 import Metadata
@@ -10,6 +11,13 @@ from evident.effect_size import (effect_size_by_category,
                                  pairwise_effect_size_by_category)
 
 
+# Data handlers memoized on the identity of the inputs they were built from so
+#     that methods called back-to-back on the same inputs share one handler.
+#     Entries are evicted when any input is garbage collected so that an
+#     object ID is never matched to a different input.
+_HANDLER_CACHE = dict()
+
+
 def _check_provided_univariate_data(sample_metadata, data_column):
     """Check if provided univariate data is valid."""
     if data_column not in sample_metadata.columns:
@@ -18,6 +26,46 @@ def _check_provided_univariate_data(sample_metadata, data_column):
         raise ValueError("Values in data_column must be numeric.")
 
 
+def _get_cached_handler(inputs: tuple, params: tuple, build: Callable):
+    """Get data handler for inputs, building it only if not cached."""
+    key = tuple(id(x) for x in inputs) + params
+    if key not in _HANDLER_CACHE:
+        dh = build()
+        try:
+            for x in inputs:
+                weakref.finalize(x, _HANDLER_CACHE.pop, key, None)
+        except TypeError:  # Input does not support weak references
+            return dh
+        _HANDLER_CACHE[key] = dh
+    return _HANDLER_CACHE[key]
+
+
+def _get_univariate_handler(sample_metadata, data_column, handler, *args):
+    """Get univariate data handler with data_column as the data."""
+    def build():
+        md = sample_metadata.to_dataframe()
+        _check_provided_univariate_data(md, data_column)
+        # data_column is numeric so it is discarded by the data handler
+        return handler(md[data_column], md, *args)
+
+    params = (handler, data_column) + args
+    return _get_cached_handler((sample_metadata, ), params, build)
+
+
+def _get_multivariate_handler(data, sample_metadata, *args):
+    """Get multivariate data handler."""
+    # QIIME 2 re-reads the DistanceMatrix view from the artifact on every
+    #     method call so data is a new object each time and this never hits
+    #     the cache across calls. Only the univariate methods, whose only input
+    #     is the Metadata object, benefit from caching.
+    def build():
+        md = sample_metadata.to_dataframe()
+        return MultivariateDataHandler(data, md, *args)
+
+    params = (MultivariateDataHandler, ) + args
+    return _get_cached_handler((data, sample_metadata), params, build)
+
+
 def univariate_power_analysis(
     sample_metadata: Metadata,
     group_column: str,
@@ -29,15 +77,10 @@ def univariate_power_analysis(
     total_observations: list = None,
     difference: list = None,
 ) -> pd.DataFrame:
-    sample_metadata = sample_metadata.to_dataframe()
-    _check_provided_univariate_data(sample_metadata, data_column)
-    data = sample_metadata[data_column]
-    sample_metadata = sample_metadata.drop(columns=[data_column])
-
-    res = _power_analysis(data, sample_metadata, group_column,
-                          UnivariateDataHandler,
-                          max_levels_per_category, min_count_per_level,
-                          alpha=alpha, power=power,
+    dh = _get_univariate_handler(sample_metadata, data_column,
+                                 UnivariateDataHandler,
+                                 max_levels_per_category, min_count_per_level)
+    res = _power_analysis(dh, group_column, alpha=alpha, power=power,
                           total_observations=total_observations,
                           difference=difference)
     return res
@@ -54,20 +97,16 @@ def multivariate_power_analysis(
     total_observations: list = None,
     difference: list = None,
 ) -> pd.DataFrame:
-    sample_metadata = sample_metadata.to_dataframe()
-    res = _power_analysis(data, sample_metadata, group_column,
-                          MultivariateDataHandler,
-                          max_levels_per_category, min_count_per_level,
-                          alpha=alpha, power=power,
+    dh = _get_multivariate_handler(data, sample_metadata,
+                                   max_levels_per_category,
+                                   min_count_per_level)
+    res = _power_analysis(dh, group_column, alpha=alpha, power=power,
                           total_observations=total_observations,
                           difference=difference)
     return res
 
 
-def _power_analysis(data, metadata, group_column, handler,
-                    max_levels_per_category, min_count_per_level, **kwargs):
-    dh = handler(data, metadata, max_levels_per_category,
-                 min_count_per_level)
+def _power_analysis(dh, group_column, **kwargs):
     res = dh.power_analysis(group_column, **kwargs)
     return res.to_dataframe()
 
@@ -81,15 +120,10 @@ def univariate_effect_size_by_category(
     max_levels_per_category: int = 5,
     min_count_per_level: int = 3
 ) -> pd.DataFrame:
-    sample_metadata = sample_metadata.to_dataframe()
-    _check_provided_univariate_data(sample_metadata, data_column)
-    data = sample_metadata[data_column]
-    sample_metadata = sample_metadata.drop(columns=[data_column])
-
-    res = _effect_size_by_category(data, sample_metadata,
-                                   UnivariateDataHandler, group_columns,
-                                   pairwise, n_jobs, max_levels_per_category,
-                                   min_count_per_level)
+    dh = _get_univariate_handler(sample_metadata, data_column,
+                                 UnivariateDataHandler,
+                                 max_levels_per_category, min_count_per_level)
+    res = _effect_size_by_category(dh, group_columns, pairwise, n_jobs)
     return res
 
 
@@ -102,19 +136,14 @@ def multivariate_effect_size_by_category(
     max_levels_per_category: int = 5,
     min_count_per_level: int = 3
 ) -> pd.DataFrame:
-    sample_metadata = sample_metadata.to_dataframe()
-    res = _effect_size_by_category(data, sample_metadata,
-                                   MultivariateDataHandler, group_columns,
-                                   pairwise, n_jobs, max_levels_per_category,
+    dh = _get_multivariate_handler(data, sample_metadata,
+                                   max_levels_per_category,
                                    min_count_per_level)
+    res = _effect_size_by_category(dh, group_columns, pairwise, n_jobs)
     return res
 
 
-def _effect_size_by_category(data, metadata, handler, columns, pairwise,
-                             n_jobs, max_levels_per_category,
-                             min_count_per_level):
-    dh = handler(data, metadata, max_levels_per_category,
-                 min_count_per_level)
+def _effect_size_by_category(dh, columns, pairwise, n_jobs):
     if pairwise:
         res = pairwise_effect_size_by_category(dh, columns, n_jobs=n_jobs)
     else:
@@ -135,14 +164,9 @@ def univariate_power_analysis_repeated_measures(
     max_levels_per_category: int = 5,
     min_count_per_level: int = 3,
 ) -> pd.DataFrame:
-    sample_metadata = sample_metadata.to_dataframe()
-    _check_provided_univariate_data(sample_metadata, data_column)
-    data = sample_metadata[data_column]
-    sample_metadata = sample_metadata.drop(columns=[data_column])
-
-    dh = RDH(data, sample_metadata,
-             individual_id_column, max_levels_per_category,
-             min_count_per_level)
+    dh = _get_univariate_handler(sample_metadata, data_column, RDH,
+                                 individual_id_column,
+                                 max_levels_per_category, min_count_per_level)
 
     results = dh.power_analysis(
         state_column,
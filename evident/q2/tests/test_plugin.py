@@ -1,3 +1,4 @@
+import gc
 import os
 
 import numpy as np
@@ -6,6 +7,9 @@ import pytest
 from qiime2 import Artifact, Metadata
 from qiime2.plugins import evident
 
+from evident import UnivariateDataHandler
+from evident.q2 import _methods
+
 
 @pytest.fixture(scope="module")
 def alpha_artifact():
@@ -272,3 +276,55 @@ def test_univariate_bad_data(alpha_artifact, metadata, metadata_w_data):
         )
     exp_err_msg = "Values in data_column must be numeric."
     assert str(exc_info.value) == exp_err_msg
+
+
+def test_univariate_handler_cached(metadata_w_data):
+    dh_1 = _methods._get_univariate_handler(
+        metadata_w_data, "alpha_div", UnivariateDataHandler, 5, 3
+    )
+    dh_2 = _methods._get_univariate_handler(
+        metadata_w_data, "alpha_div", UnivariateDataHandler, 5, 3
+    )
+    assert dh_1 is dh_2
+
+
+def test_univariate_handler_cache_params(metadata_w_data):
+    class OtherHandler(UnivariateDataHandler):
+        pass
+
+    md = metadata_w_data.to_dataframe()
+    md["alpha_div_2"] = md["alpha_div"] * 2
+    md = Metadata(md)
+
+    dh = _methods._get_univariate_handler(
+        md, "alpha_div", UnivariateDataHandler, 5, 3
+    )
+    diff_column = _methods._get_univariate_handler(
+        md, "alpha_div_2", UnivariateDataHandler, 5, 3
+    )
+    diff_levels = _methods._get_univariate_handler(
+        md, "alpha_div", UnivariateDataHandler, 4, 3
+    )
+    diff_handler = _methods._get_univariate_handler(
+        md, "alpha_div", OtherHandler, 5, 3
+    )
+    assert diff_column is not dh
+    assert diff_levels is not dh
+    assert diff_handler is not dh
+    assert type(diff_handler) is OtherHandler
+    np.testing.assert_allclose(
+        diff_column.data.values, dh.data.values * 2
+    )
+
+
+def test_univariate_handler_cache_evicted(metadata_w_data):
+    md = Metadata(metadata_w_data.to_dataframe())
+    key = (id(md), UnivariateDataHandler, "alpha_div", 5, 3)
+    _methods._get_univariate_handler(
+        md, "alpha_div", UnivariateDataHandler, 5, 3
+    )
+    assert key in _methods._HANDLER_CACHE
+
+    del md
+    gc.collect()
+    assert key not in _methods._HANDLER_CACHE
@@ -1,6 +1,6 @@
 import numpy as np
 import pandas as pd
-from scipy import stats
+from scipy import special, stats
 
 
 def calculate_pooled_stdev(*arrays) -> float:
@@ -14,16 +14,11 @@ def calculate_pooled_stdev(*arrays) -> float:
     :returns: Pooled standard deviation
     :rtype: float
     """
-    pooled_variance_numerator = 0
-    lengths = []
     k = len(arrays)
+    counts, _, variances = _calculate_group_moments(*arrays)
 
-    for array in arrays:
-        sample_variance = np.var(array, ddof=1)  # delta DF = 1 for unbiased
-        pooled_variance_numerator += sample_variance * (len(array) - 1)
-        lengths.append(len(array))
-
-    pooled_variance_denominator = sum(lengths) - k
+    pooled_variance_numerator = np.sum((counts - 1) * variances)
+    pooled_variance_denominator = counts.sum() - k
     pooled_variance = pooled_variance_numerator / pooled_variance_denominator
 
     return np.sqrt(pooled_variance)
@@ -47,6 +42,31 @@ def calculate_cohens_d(values_1: np.ndarray, values_2: np.ndarray) -> float:
     return np.abs(mu_1 - mu_2)/pooled_std
 
 
+def calculate_pairwise_cohens_d(*arrays) -> np.ndarray:
+    """Calculate Cohen's d between every pair of arrays.
+
+    Group means and variances are computed once and all pairwise effect
+    sizes are derived by broadcasting rather than by recomputing group
+    statistics for each pair.
+
+    :param arrays: All arrays to compare
+    :type arrays: np.ndarray, np.ndarray, ...
+
+    :returns: Symmetric matrix of Cohen's d effect sizes where entry (i, j)
+        compares arrays i and j
+    :rtype: np.ndarray
+    """
+    counts, means, variances = _calculate_group_moments(*arrays)
+
+    sum_sq_dev = (counts - 1) * variances
+    pooled_variance = (
+        (sum_sq_dev[:, np.newaxis] + sum_sq_dev[np.newaxis, :])
+        / (counts[:, np.newaxis] + counts[np.newaxis, :] - 2)
+    )
+    mean_diff = means[:, np.newaxis] - means[np.newaxis, :]
+    return np.abs(mean_diff)/np.sqrt(pooled_variance)
+
+
 def calculate_cohens_f(*arrays) -> float:
     """Calculate Cohen's f using pooled standard deviation.
 
@@ -59,23 +79,50 @@ def calculate_cohens_f(*arrays) -> float:
     :returns: Cohen's f effect size
     :rtype: float
     """
-    pooled_std = calculate_pooled_stdev(*arrays)
+    k = len(arrays)
+    counts, means, variances = _calculate_group_moments(*arrays)
 
-    concat_array = np.concatenate(arrays)
-    mu_total = np.mean(concat_array)
+    total = counts.sum()
+    pooled_variance = np.sum((counts - 1) * variances) / (total - k)
+    pooled_std = np.sqrt(pooled_variance)
 
-    effect_size_numerator = 0
-    for array in arrays:
-        mu_group = np.mean(array)
-        effect_size_numerator += (
-            len(array) / len(concat_array)
-            * np.power(mu_group - mu_total, 2)
-        )
-    effect_size_numerator = np.sqrt(effect_size_numerator)
+    mu_total = np.sum(counts * means) / total
+    effect_size_numerator = np.sqrt(
+        np.sum(counts / total * np.power(means - mu_total, 2))
+    )
 
     return effect_size_numerator/pooled_std
 
 
+def _calculate_group_moments(*arrays) -> tuple:
+    """Compute per-group counts, means, and unbiased variances.
+
+    Each array is reduced in place, with no concatenated copy of the data.
+    Each group's mean is computed once and reused for its variance.
+
+    :param arrays: Values of each group
+    :type arrays: np.ndarray, np.ndarray, ...
+
+    :returns: Counts, means, and variances (delta DF = 1) of each group
+    :rtype: tuple(np.ndarray, np.ndarray, np.ndarray)
+    """
+    k = len(arrays)
+    counts = np.empty(k, dtype=int)
+    means = np.empty(k)
+    variances = np.empty(k)
+
+    for i, array in enumerate(arrays):
+        array = np.asarray(array, dtype=float)
+        counts[i] = len(array)
+        if counts[i] == 0:  # Undefined for empty groups, as with np.var
+            means[i] = variances[i] = np.nan
+            continue
+        means[i] = array.mean()
+        sum_sq_dev = np.dot(array - means[i], array - means[i])
+        variances[i] = sum_sq_dev / (counts[i] - 1)
+    return counts, means, variances
+
+
 def calculate_eta_squared(data: pd.DataFrame) -> float:
     """Calculate eta squared for repeated measures ANOVA.
 
@@ -126,6 +173,41 @@ def calculate_eta_squared(data: pd.DataFrame) -> float:
     return eta_sq
 
 
+def calculate_ttest_power(
+    effect_size: float,
+    nobs1: float,
+    alpha: float
+) -> float:
+    """Calculate power for a two-sided, two-sample t-test of equal sizes.
+
+    Power is computed directly from the noncentral t distribution so no
+    root-finding is involved. All arguments can be arrays, in which case
+    they are broadcast against each other.
+
+    :param effect_size: Effect size as Cohen's d
+    :type effect_size: float or np.ndarray
+
+    :param nobs1: Number of observations in each group
+    :type nobs1: float or np.ndarray
+
+    :param alpha: Significance level to reject null hypothesis
+    :type alpha: float or np.ndarray
+
+    :returns: Probability of rejecting null hypothesis given that the
+        alternative hypothesis is true
+    :rtype: float or np.ndarray
+    """
+    df = 2 * nobs1 - 2
+    noncentrality = effect_size * np.sqrt(nobs1 / 2)
+    crit_upper = stats.t.isf(alpha / 2, df)
+    crit_lower = stats.t.ppf(alpha / 2, df)
+    power = (
+        1 - special.nctdtr(df, noncentrality, crit_upper)
+        + special.nctdtr(df, noncentrality, crit_lower)
+    )
+    return power
+
+
 def calculate_rm_anova_power(
     subjects: int,
     measurements: int,
@@ -32,9 +32,35 @@ class TestAlphaDiv:
         np.testing.assert_almost_equal(b1_subset.mean(), 13.566,
                                        decimal=3)
 
+    def test_subset_alpha_values_missing_id(self, alpha_mock):
+        ids = pd.Index(list(alpha_mock.samples[:2]) + ["NOT_A_SAMPLE"])
+        with pytest.raises(KeyError):
+            alpha_mock.subset_values(ids)
+
     def test_alpha_samples(self, alpha_mock):
         md = alpha_mock.metadata
-        assert (md.index == alpha_mock.samples).all()
+        assert alpha_mock.samples == tuple(md.index)
+
+    def test_alpha_sorted_by(self, alpha_mock):
+        md = alpha_mock.metadata
+        order, offsets = alpha_mock._sorted_by("classification")
+        sorted_md = md.iloc[order]
+
+        # 99 B1 samples, 121 Non-B1 samples
+        np.testing.assert_equal(offsets, [0, 99, 220])
+        assert (sorted_md["classification"].iloc[:99] == "B1").all()
+        assert (sorted_md["classification"].iloc[99:] == "Non-B1").all()
+
+    def test_alpha_categorical_metadata(self, alpha_mock):
+        md = alpha_mock.metadata
+        assert (md.dtypes == "category").all()
+
+        a = UnivariateDataHandler(alpha_mock.data, md)
+        assert a.metadata.shape == md.shape
+        assert (
+            a.calculate_effect_size("cd_behavior").effect_size
+            == alpha_mock.calculate_effect_size("cd_behavior").effect_size
+        )
 
     def test_alpha_wrong_data(self, alpha_mock):
         data = alpha_mock.data.to_frame()
@@ -87,9 +113,19 @@ class TestBetaDiv:
         # 99 B1 samples -> (99*98)/2 = 4851
         assert b1_subset.shape == (4851, )
 
+    def test_subset_beta_values_missing_id(self, beta_mock):
+        ids = pd.Index(list(beta_mock.samples[:2]) + ["NOT_A_SAMPLE"])
+        with pytest.raises(KeyError) as exc_info:
+            beta_mock.subset_values(ids)
+        assert "NOT_A_SAMPLE" in str(exc_info.value)
+
+    def test_beta_data_precision(self, beta_mock):
+        assert beta_mock.data is beta_mock.data
+        assert beta_mock.data.data.dtype == np.float64
+
     def test_beta_samples(self, beta_mock):
         md = beta_mock.metadata
-        assert (md.index == beta_mock.samples).all()
+        assert beta_mock.samples == tuple(md.index)
 
     def test_beta_wrong_data(self, beta_mock):
         data = beta_mock.data.to_data_frame()
@@ -198,6 +234,21 @@ class TestPower:
         exp_power = 0.404539
         np.testing.assert_almost_equal(calc_power, exp_power, decimal=6)
 
+    def test_power_func_cached(self, alpha_mock):
+        assert alpha_mock._power_func_cache == dict()
+
+        func_1 = alpha_mock._create_partial_power_func("classification", 40)
+        assert alpha_mock._power_func_cache == {("classification", 40): func_1}
+
+        func_2 = alpha_mock._create_partial_power_func("classification", 40)
+        assert func_1 is func_2
+        assert len(alpha_mock._power_func_cache) == 1
+
+        func_3 = alpha_mock._create_partial_power_func("classification", 60)
+        assert func_3 is not func_1
+        assert alpha_mock._power_func_cache[("classification", 60)] is func_3
+        assert len(alpha_mock._power_func_cache) == 2
+
 
 class TestEffectSize:
     def test_difference(self, alpha_mock):
@@ -235,3 +286,40 @@ class TestVectorArgsPowerAnalysis:
             alpha=0.05
         )
         assert len(power_res) == 5
+
+    def test_np_array_power(self, alpha_mock):
+        power_res = alpha_mock.power_analysis(
+            column="classification",
+            power=np.array([0.8, 0.9]),
+            alpha=0.05
+        )
+        assert len(power_res) == 2
+
+        obs_res = alpha_mock.power_analysis(
+            column="classification",
+            total_observations=np.array([20, 40]),
+            alpha=0.05
+        )
+        assert len(obs_res) == 2
+
+    def test_power_grid(self, alpha_mock):
+        obs_values = [20, 40]
+        alpha_values = [0.01, 0.05]
+        diff_values = [None, 2.5]
+        power_res = alpha_mock.power_analysis(
+            column="cd_behavior",
+            total_observations=obs_values,
+            alpha=alpha_values,
+            difference=diff_values
+        )
+        assert len(power_res) == 8
+
+        for vector_res in power_res:
+            single_res = alpha_mock.power_analysis(
+                column="cd_behavior",
+                total_observations=vector_res.total_observations,
+                alpha=vector_res.alpha,
+                difference=vector_res.difference
+            )
+            np.testing.assert_almost_equal(single_res.power,
+                                           vector_res.power, decimal=12)
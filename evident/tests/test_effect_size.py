@@ -110,6 +110,22 @@ def test_pairwise_effect_size_by_cat_parallel(mock, request):
     pd.testing.assert_frame_equal(df_1, df_2)
 
 
+@pytest.mark.parametrize("mock", ["alpha_mock", "beta_mock"])
+def test_effect_size_by_cat_process_backend(mock, request):
+    dh = request.getfixturevalue(mock)
+    columns = ["perianal_disease", "sex", "classification", "cd_behavior"]
+
+    df_1 = expl.effect_size_by_category(dh, columns).to_dataframe()
+    df_2 = expl.effect_size_by_category(
+        dh,
+        columns,
+        n_jobs=2,
+        parallel_args={"backend": "loky"}
+    ).to_dataframe()
+
+    pd.testing.assert_frame_equal(df_1, df_2)
+
+
 @pytest.mark.parametrize("mock", ["alpha_mock", "beta_mock"])
 def test_no_cols(mock, request):
     dh = request.getfixturevalue(mock)
@@ -1,4 +1,5 @@
 import numpy as np
+from statsmodels.stats.power import tt_ind_solve_power
 
 from evident import stats
 
@@ -39,3 +40,54 @@ def test_calc_cohens_f_two_groups():
     exp_cohen_f = 0.852803 / 2
     calc_cohen_f = stats.calculate_cohens_f(a, b)
     np.testing.assert_almost_equal(exp_cohen_f, calc_cohen_f, decimal=6)
+
+
+def test_calc_cohens_f_three_groups():
+    a = [1, 2, 3, 4, 5, 6]
+    b = [2, 5, 3, 6, 8, 9]
+    c = [0, 2, 2, 5, 1, 4, 7]
+
+    exp_cohen_f = 0.450665
+    calc_cohen_f = stats.calculate_cohens_f(a, b, c)
+    np.testing.assert_almost_equal(exp_cohen_f, calc_cohen_f, decimal=6)
+
+
+def test_calc_ttest_power():
+    effect_sizes = np.array([0.2, 0.5, 0.8])
+    nobs1 = 20
+    alpha = 0.05
+
+    calc_power = stats.calculate_ttest_power(effect_sizes, nobs1, alpha)
+    exp_power = [
+        tt_ind_solve_power(effect_size=x, nobs1=nobs1, alpha=alpha)
+        for x in effect_sizes
+    ]
+    np.testing.assert_almost_equal(exp_power, calc_power, decimal=10)
+
+
+def test_calc_pairwise_cohens_d():
+    a = [1, 2, 3, 4, 5, 6]
+    b = [2, 5, 3, 6, 8, 9]
+    c = [0, 2, 2, 5, 1, 4, 7]
+    arrays = [a, b, c]
+
+    calc_cohen_d = stats.calculate_pairwise_cohens_d(*arrays)
+    assert calc_cohen_d.shape == (3, 3)
+    np.testing.assert_almost_equal(calc_cohen_d[0, 1], 0.852803, decimal=6)
+    for i in range(3):
+        for j in range(3):
+            exp_cohen_d = stats.calculate_cohens_d(arrays[i], arrays[j])
+            np.testing.assert_almost_equal(exp_cohen_d, calc_cohen_d[i, j],
+                                           decimal=10)
+
+
+def test_empty_group():
+    a = [1, 2, 3, 4, 5, 6]
+    b = [2, 5, 3, 6, 8, 9]
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        assert np.isnan(stats.calculate_pooled_stdev(a, b, []))
+        assert np.isnan(stats.calculate_cohens_f(a, b, []))
+        calc_cohen_d = stats.calculate_pairwise_cohens_d(a, b, [])
+    assert calc_cohen_d.shape == (3, 3)
+    assert np.isnan(calc_cohen_d[:, 2]).all()
@@ -1,6 +1,8 @@
 from typing import Any, Iterable
 from warnings import warn
 
+import pandas as pd
+
 
 def _listify(x: Any):
     """Convert value to list if it is not already iterable."""
@@ -10,12 +12,13 @@ def _listify(x: Any):
         return x
 
 
-def _check_sample_overlap(ids1: set, ids2: set):
+def _check_sample_overlap(ids1: pd.Index, ids2: pd.Index) -> pd.Index:
+    """Get samples common to both indices, warning if they differ."""
     overlap = ids1.intersection(ids2)
-    if ids1 != ids2:
+    if not (len(overlap) == len(ids1) == len(ids2)):
         msg = (
             "Data and metadata do not have the same sample IDs. Using "
             f"{len(overlap)} samples common to both."
         )
         warn(msg)
-    return list(overlap)
+    return overlap